@@ -24,8 +24,10 @@ from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import ApiError
 from .api import AuthError
@@ -36,6 +38,7 @@ from .const import CONF_USERNAME
 from .const import DEFAULT_SCAN_INTERVAL
 from .const import DOMAIN
 from .const import PLATFORMS
+from .entity import _safe_float
 
 # Our local library code
 # Shared constants
@@ -47,6 +50,69 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 # Configuration schema for YAML configuration
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Tank fields the API reports as numeric strings. They are converted to
+# float (or None) once at ingestion so entity reads never re-parse them.
+_NUMERIC_TANK_FIELDS = ("sensor_gallons", "nominal", "fillable", "sensor_usg", "low_level")
+
+# Cooldown (seconds) for coalescing back-to-back refresh requests. A burst of
+# async_request_refresh calls (e.g. after a re-auth or an options reload)
+# results in a single API round-trip instead of several overlapping ones.
+REQUEST_REFRESH_COOLDOWN = 10.0
+
+
+def _normalize_tank_data(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Normalize freshly fetched API data and build the {tank_id: tank} index.
+
+    The API is inconsistent about whether tank_id is an int or a string.
+    Coercing it to str once here means every downstream consumer (entity
+    lookups, created-id bookkeeping, unique_ids) can use plain string
+    comparisons without re-converting per tank per access. The index is
+    built in the same pass, so ingestion walks the tank list exactly once.
+    """
+    tanks_by_id: dict[str, dict[str, Any]] = {}
+    tanks = data.get("tanks") if isinstance(data, dict) else None
+    if isinstance(tanks, list):
+        for tank in tanks:
+            tank_id = str(tank.get("tank_id", "unknown"))
+            tank["tank_id"] = tank_id
+            tanks_by_id[tank_id] = tank
+
+            # Convert numeric strings to floats once; unparseable or
+            # missing values become None.
+            for field in _NUMERIC_TANK_FIELDS:
+                tank[field] = _safe_float(tank.get(field))
+
+            # Convert the last-read epoch to an aware local datetime once
+            # here, so LastReadSensor reads are plain dict gets instead of
+            # per-read timezone arithmetic.
+            try:
+                epoch = int(tank.get("last_read"))
+            except (ValueError, TypeError):
+                tank["_last_read_dt"] = None
+            else:
+                tank["_last_read_dt"] = dt_util.as_local(
+                    dt_util.utc_from_timestamp(epoch)
+                )
+
+            # Derive percent full once here rather than dividing on every
+            # PercentFullSensor read. Also keeps the stored value stable
+            # for always_update=False equality checks.
+            gallons = tank["sensor_gallons"] or 0.0
+            capacity = tank["nominal"] or 0.0
+            tank["_percent_full"] = (
+                round(gallons / capacity * 100.0, 2) if capacity > 0 else 0.0
+            )
+
+            # Pick the battery icon once per refresh; the only documented
+            # good value is "excellent", anything else shows a warning.
+            battery = tank.get("battery")
+            tank["_battery_icon"] = (
+                "mdi:battery"
+                if isinstance(battery, str) and battery.lower() == "excellent"
+                else "mdi:battery-alert"
+            )
+    return tanks_by_id
+
 
 # --------------------------------------------------------------------------------------
 # 1. async_setup
@@ -102,6 +168,11 @@ class SmartOilGaugeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._username = username
         self._password = password
 
+        # {tank_id: tank} index rebuilt once per successful update, so
+        # entity property reads are single dict gets instead of walking
+        # the tank list per read.
+        self.tanks_by_id: dict[str, dict[str, Any]] = {}
+
         # Call superclass constructor
         # update_interval defines how often HA will call _async_update_data()
         super().__init__(
@@ -109,8 +180,26 @@ class SmartOilGaugeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,  # name shown in logs
             update_interval=timedelta(seconds=scan_interval),
+            # Tank readings change on the order of hours, so most polls
+            # return identical data. Skipping listener notification and
+            # state writes for unchanged data avoids rewriting every
+            # entity's state on every tick.
+            always_update=False,
+            # Coalesce bursts of refresh requests; the coordinator wires
+            # its own refresh function into the debouncer.
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=True,
+            ),
         )
 
+    def _ingest(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Normalize fetched data and rebuild the per-update tank index."""
+        self.tanks_by_id = _normalize_tank_data(data)
+        return data
+
     async def _async_update_data(self) -> dict[str, Any]:
         """
         This is called by Home Assistant based on update_interval OR when manually refreshed.
@@ -121,7 +210,7 @@ class SmartOilGaugeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         try:
             # Attempt normal API fetch
-            return await self._client.get_tanks_list()
+            return self._ingest(await self._client.get_tanks_list())
 
         except AuthError:
             # This is expected when session tokens expire
@@ -132,25 +221,25 @@ class SmartOilGaugeDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 await self._client.login(self._username, self._password)
 
                 # If login succeeds, retry the original request
-                return await self._client.get_tanks_list()
+                return self._ingest(await self._client.get_tanks_list())
 
             except AuthError as err:
                 # Login attempt failed -> trigger Home Assistant reauth flow
                 raise ConfigEntryAuthFailed from err
 
-            except Exception as err:
-                # Something else went wrong while trying to reauthenticate
-                # This still counts as a recoverable failure
-                raise UpdateFailed(f"Re-login failed: {err}") from err
+            except ApiError as err:
+                # Network/API trouble while re-authenticating; the client
+                # wraps all timeouts and transport errors into ApiError.
+                # This still counts as a recoverable failure.
+                raise UpdateFailed(str(err)) from err
 
         except ApiError as err:
-            # Any API-specific error that is not authentication related
+            # Any API-specific error that is not authentication related.
+            # Truly unexpected exceptions propagate; the coordinator base
+            # class logs those as errors rather than hiding them behind
+            # a generic UpdateFailed.
             raise UpdateFailed(str(err)) from err
 
-        except Exception as err:
-            # Unexpected error  still recoverable
-            raise UpdateFailed(f"Unexpected error: {err}") from err
-
 
 # --------------------------------------------------------------------------------------
 # 3. async_setup_entry
@@ -253,8 +342,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Remove the coordinator for this entry
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        # Remove the coordinator for this entry and cancel its scheduled
+        # refresh and debouncer so nothing fires after unload.
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
 
     return unload_ok
 
@@ -15,15 +15,24 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
+from types import MappingProxyType
 from typing import Any
-from typing import Dict
-from typing import Optional
 
 import aiohttp
+from yarl import URL
 
 from .const import AJAX_URL
 from .const import LOGIN_URL
 
+# orjson parses the tank-list JSON several times faster than the stdlib and
+# ships with Home Assistant core, so it is always available there. The stdlib
+# fallback keeps this module usable outside HA (it imports nothing from HA).
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
 _LOGGER = logging.getLogger(__name__)
 
 # --------------------------------------------------------------------------------------
@@ -32,7 +41,32 @@ _LOGGER = logging.getLogger(__name__)
 
 # The login form on app.smartoilgauge.com includes a hidden input "ccf_nonce"
 # with a random value that must be submitted with credentials.
-_NONCE_RE = re.compile(r'name=["\']ccf_nonce["\']\s+value=["\']([^"\']+)["\']', re.I)
+#
+# This is a bytes pattern so the login page can be searched as it streams in,
+# without decoding the whole body first (see _fetch_nonce).
+_NONCE_RE = re.compile(rb'name=["\']ccf_nonce["\']\s+value=["\']([^"\']+)["\']', re.I)
+
+# How much of the login page to read while looking for the nonce. The hidden
+# input sits in the form near the top of the page; this bound keeps a
+# misbehaving server from making us buffer an arbitrarily large body.
+_NONCE_SEARCH_LIMIT = 64 * 1024
+
+# Markers that indicate a response body is (still) the login page. Compiled
+# once at import so each response is scanned in a single pass instead of
+# several separate substring searches over possibly-large HTML bodies.
+#
+# For login(): either the password field is present, or the page contains both
+# the "Login" and "Smart Oil Gauge" strings (in either order). The gap between
+# the two markers is bounded so an adversarially large page cannot trigger
+# quadratic backtracking; on the real login page they sit within a few KB of
+# each other.
+_LOGIN_FAIL_RE = re.compile(
+    r"user_pass|Login.{0,4096}Smart Oil Gauge|Smart Oil Gauge.{0,4096}Login", re.S
+)
+
+# For get_tanks_list(): any login-page marker in a non-JSON body means the
+# session has expired and we were served the login page instead.
+_LOGIN_PAGE_RE = re.compile(r"ccf_nonce|user_pass|Login")
 
 # Field names in the login form POST body
 USER_FIELD = "username"
@@ -41,6 +75,47 @@ PASS_FIELD = "user_pass"
 # Timeouts in seconds for HTTP calls
 DEFAULT_TIMEOUT = 15
 
+# Request headers and payloads are identical on every call, so they are
+# built once here instead of on each request. MappingProxyType keeps them
+# read-only; aiohttp accepts any mapping.
+_LOGIN_HEADERS = MappingProxyType(
+    {
+        "Origin": "https://app.smartoilgauge.com",
+        "Referer": LOGIN_URL,
+        "Content-Type": "application/x-www-form-urlencoded",
+        "User-Agent": "Mozilla/5.0",
+        # Keep-alive is aiohttp's default; stated explicitly so the nonce
+        # GET, login POST, and tank-list POST share one connection and a
+        # future change doesn't silently regress to per-request handshakes.
+        "Connection": "keep-alive",
+    }
+)
+
+_AJAX_HEADERS = MappingProxyType(
+    {
+        "X-Requested-With": "XMLHttpRequest",
+        "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
+        "Accept": "application/json",
+        "Origin": "https://app.smartoilgauge.com",
+        "Referer": "https://app.smartoilgauge.com/",
+        "User-Agent": "Mozilla/5.0",
+        "Connection": "keep-alive",
+    }
+)
+
+_AJAX_PAYLOAD = "action=get_tanks_list&tank_id=0"
+
+# Cookie names the server sets for an authenticated session. If one is
+# present in the session's cookie jar, the login nonce is bound to that
+# session and a cached nonce can be reused without re-fetching the page.
+_SESSION_COOKIE_NAMES = ("PHPSESSID", "ccf_tok")
+_BASE_URL = URL("https://app.smartoilgauge.com/")
+
+# How long a previously fetched nonce is reused before fetching a fresh one.
+# Re-login after session expiry normally needs a nonce GET plus the login
+# POST; reusing a recent nonce skips the extra round-trip.
+_NONCE_TTL = 600
+
 
 # --------------------------------------------------------------------------------------
 # Custom exceptions
@@ -74,38 +149,86 @@ class SmartOilClient:
         """
         self._session = session
 
+        # Cached login nonce, reused across logins within _NONCE_TTL seconds
+        # to avoid an extra GET of the login page on every re-auth.
+        self._nonce: str | None = None
+        self._nonce_ts: float = 0.0
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    async def _fetch_nonce(self) -> Optional[str]:
+    def _has_session_cookie(self) -> bool:
+        """Return True if the session's cookie jar holds an auth cookie."""
+        cookies = self._session.cookie_jar.filter_cookies(_BASE_URL)
+        return any(name in cookies for name in _SESSION_COOKIE_NAMES)
+
+    async def _fetch_nonce(self) -> str | None:
         """
         Fetch the login page and extract the 'ccf_nonce' hidden field.
 
         This nonce is typically required when posting credentials to the
         login endpoint. If we cannot extract it, we simply proceed without it
         and let the server decide, though it is not expected to work.
+
+        The page is searched incrementally as it streams in, so we stop
+        reading (and decoding) as soon as the hidden field is found instead
+        of buffering the whole body.
         """
         _LOGGER.debug("SmartOilClient: fetching login page to obtain nonce")
 
+        match = None
         try:
             async with self._session.get(LOGIN_URL, timeout=DEFAULT_TIMEOUT) as resp:
-                text = await resp.text()
+                buf = bytearray()
+                async for chunk in resp.content.iter_chunked(4096):
+                    buf += chunk
+                    match = _NONCE_RE.search(buf)
+                    if match or len(buf) >= _NONCE_SEARCH_LIMIT:
+                        break
         except asyncio.TimeoutError as err:
             raise ApiError("Timeout fetching login page") from err
         except aiohttp.ClientError as err:
             raise ApiError(f"Error fetching login page: {err}") from err
 
-        match = _NONCE_RE.search(text)
         if not match:
             _LOGGER.debug(
                 "SmartOilClient: no ccf_nonce hidden field found on login page"
             )
             return None
 
-        nonce = match.group(1)
+        # Only the captured nonce is ever decoded; it is ASCII by the form's
+        # contract, so no charset detection or full-page decode is needed.
+        nonce = match.group(1).decode("ascii", errors="replace")
         _LOGGER.debug("SmartOilClient: extracted ccf_nonce=%s", nonce)
         return nonce
 
+    async def _post_login(self, data: dict[str, str]) -> str:
+        """POST the login form and return the response body as text.
+
+        Raises AuthError/ApiError for explicit HTTP-level failures; the
+        caller inspects the returned HTML for login-page markers.
+        """
+        try:
+            async with self._session.post(
+                LOGIN_URL,
+                data=data,
+                headers=_LOGIN_HEADERS,
+                allow_redirects=True,
+                timeout=DEFAULT_TIMEOUT,
+            ) as resp:
+                # If the server returns explicit HTTP errors (4xx/5xx), treat as auth or API error
+                if resp.status >= 500:
+                    raise ApiError(f"Login failed with HTTP {resp.status}")
+                if resp.status in (401, 403):
+                    raise AuthError(f"Login unauthorized, HTTP {resp.status}")
+
+                return await resp.text()
+
+        except asyncio.TimeoutError as err:
+            raise ApiError("Timeout posting login form") from err
+        except aiohttp.ClientError as err:
+            raise ApiError(f"HTTP error during login: {err}") from err
+
     # ------------------------------------------------------------------
     # Public methods
     # ------------------------------------------------------------------
@@ -114,15 +237,35 @@ class SmartOilClient:
         Perform login with the given username and password.
 
         This method:
-        - Fetches the nonce from the login page (if available).
+        - Fetches the nonce from the login page (if available), reusing a
+          recently cached one to skip the extra round-trip.
         - POSTs the credentials + nonce back to LOGIN_URL.
         - Inspects the resulting HTML to see if we are still on a login page
-          or obviously unauthenticated, and raises AuthError in that case.
+          or obviously unauthenticated. If a *cached* nonce was used, it
+          retries exactly once with a freshly fetched nonce first — the
+          server may have expired or consumed the old one, which looks
+          identical to bad credentials in the response.
 
         On success, any auth cookies set by the server are stored in the
         underlying aiohttp.ClientSession and reused by subsequent requests.
         """
-        nonce = await self._fetch_nonce()
+        # Reuse the cached nonce while it is fresh, or — since the nonce is
+        # bound to the session — for as long as the session cookie survives.
+        # A stale reused nonce is safe either way: the retry below falls
+        # back to a fresh fetch before the failure is surfaced.
+        used_cached_nonce = bool(
+            self._nonce
+            and (
+                time.monotonic() - self._nonce_ts < _NONCE_TTL
+                or self._has_session_cookie()
+            )
+        )
+        if used_cached_nonce:
+            nonce = self._nonce
+        else:
+            nonce = await self._fetch_nonce()
+            self._nonce = nonce
+            self._nonce_ts = time.monotonic()
 
         data = {
             USER_FIELD: username,
@@ -131,48 +274,53 @@ class SmartOilClient:
         if nonce:
             data["ccf_nonce"] = nonce
 
-        headers = {
-            "Origin": "https://app.smartoilgauge.com",
-            "Referer": LOGIN_URL,
-            "Content-Type": "application/x-www-form-urlencoded",
-            "User-Agent": "Mozilla/5.0",
-        }
-
         _LOGGER.debug("SmartOilClient: posting login for user=%s", username)
 
-        try:
-            async with self._session.post(
-                LOGIN_URL,
-                data=data,
-                headers=headers,
-                allow_redirects=True,
-                timeout=DEFAULT_TIMEOUT,
-            ) as resp:
-                # If the server returns explicit HTTP errors (4xx/5xx), treat as auth or API error
-                if resp.status >= 500:
-                    raise ApiError(f"Login failed with HTTP {resp.status}")
-                if resp.status in (401, 403):
-                    raise AuthError(f"Login unauthorized, HTTP {resp.status}")
-
-                text = await resp.text()
-
-        except asyncio.TimeoutError as err:
-            raise ApiError("Timeout posting login form") from err
-        except aiohttp.ClientError as err:
-            raise ApiError(f"HTTP error during login: {err}") from err
+        text = await self._post_login(data)
 
         # Heuristic: if the returned page still looks like a login form, login likely failed.
         # We look for markers like the password field name or typical "Login" text.
-        if 'name="user_pass"' in text or "user_pass" in text:
-            # This strongly suggests we are still on the login page.
-            raise AuthError("Login form still present after POST; bad credentials?")
-        if "Login" in text and "Smart Oil Gauge" in text:
+        match = _LOGIN_FAIL_RE.search(text)
+
+        if match and used_cached_nonce:
+            # The server may simply have rejected the stale cached nonce
+            # rather than the credentials. Start clean — drop the nonce and
+            # any stale session cookies — and retry once with a fresh one
+            # before concluding the credentials are at fault.
+            _LOGGER.debug(
+                "SmartOilClient: login with cached nonce rejected; "
+                "retrying once with a fresh nonce"
+            )
+            self._session.cookie_jar.clear_domain(_BASE_URL.host)
+            nonce = await self._fetch_nonce()
+            self._nonce = nonce
+            self._nonce_ts = time.monotonic()
+            if nonce:
+                data["ccf_nonce"] = nonce
+            else:
+                data.pop("ccf_nonce", None)
+
+            text = await self._post_login(data)
+            match = _LOGIN_FAIL_RE.search(text)
+
+        if match:
+            # Even the fresh nonce was rejected; make the next attempt
+            # start completely clean.
+            self._nonce = None
+            self._session.cookie_jar.clear_domain(_BASE_URL.host)
+            # The single-pass regex above only decides *whether* this is a
+            # login page; which marker matched first is layout-dependent
+            # (the page title usually precedes the form), so pick the
+            # message with a plain full-text check for the password field.
+            if "user_pass" in text:
+                # This strongly suggests we are still on the login page.
+                raise AuthError("Login form still present after POST; bad credentials?")
             # Some variants may show a generic login page.
             raise AuthError("Login page returned; credentials may be invalid")
 
         _LOGGER.debug("SmartOilClient: login POST completed without obvious errors")
 
-    async def get_tanks_list(self) -> Dict[str, Any]:
+    async def get_tanks_list(self) -> dict[str, Any]:
         """
         Fetch the list of tanks via the AJAX API.
 
@@ -186,23 +334,13 @@ class SmartOilClient:
         The coordinator expects the returned data to be a dict, ideally with:
             { "tanks": [ { ...tank fields... }, ... ] }
         """
-        payload = "action=get_tanks_list&tank_id=0"
-        headers = {
-            "X-Requested-With": "XMLHttpRequest",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Accept": "application/json",
-            "Origin": "https://app.smartoilgauge.com",
-            "Referer": "https://app.smartoilgauge.com/",
-            "User-Agent": "Mozilla/5.0",
-        }
-
         _LOGGER.debug("SmartOilClient: requesting tank list from AJAX endpoint")
 
         try:
             async with self._session.post(
                 AJAX_URL,
-                data=payload,
-                headers=headers,
+                data=_AJAX_PAYLOAD,
+                headers=_AJAX_HEADERS,
                 timeout=DEFAULT_TIMEOUT,
             ) as resp:
                 # If unauthenticated at HTTP level, raise AuthError immediately
@@ -217,19 +355,26 @@ class SmartOilClient:
 
                 # Capture Content-Type before reading body
                 ctype = resp.headers.get("Content-Type", "")
-                text = await resp.text()
 
-                # If the response is not JSON, check if it looks like a login page
+                # If the response is not JSON, check if it looks like a login
+                # page. Only peek at the head of the body — the login-page
+                # markers all appear early, and an unexpected HTML error page
+                # can be large.
                 if "application/json" not in ctype:
-                    if "ccf_nonce" in text or "user_pass" in text or "Login" in text:
+                    peek = (await resp.content.read(4096)).decode(
+                        "utf-8", errors="replace"
+                    )
+                    if _LOGIN_PAGE_RE.search(peek):
                         # Backend sent us an HTML login page instead of JSON
                         raise AuthError("Session expired or not authenticated")
                     raise ApiError(f"Unexpected content type: {ctype!r}")
 
-                # Now we know it's supposed to be JSON
+                # Now we know it's supposed to be JSON. Decode the raw bytes
+                # ourselves (we already validated Content-Type above) instead
+                # of going through resp.json()'s charset/content-type checks.
                 try:
-                    data: Any = await resp.json()
-                except Exception as err:  # JSON decoding error
+                    data: Any = _json_loads(await resp.read())
+                except ValueError as err:  # JSON decoding error
                     raise ApiError(f"Failed to decode JSON: {err}") from err
 
         except asyncio.TimeoutError as err:
@@ -8,9 +8,6 @@ Defines binary_sensor entities for the integration:
 from __future__ import annotations
 
 import logging
-from typing import Any
-from typing import Iterable
-from typing import List
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.components.binary_sensor import BinarySensorEntity
@@ -21,8 +18,6 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity import _safe_float
-from .entity import _tanks_from
 from .entity import SmartOilTankEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,18 +33,11 @@ async def async_setup_entry(
 
     created_tank_ids: set[str] = set()
 
-    def build_entities_for_tank(tank: dict[str, Any]) -> Iterable[Entity]:
-        tank_id = str(tank.get("tank_id", "unknown"))
-        return (LowOilSensor(coordinator, entry, tank_id),)
-
-    entities: List[Entity] = []
-
-    tanks = _tanks_from(coordinator.data)
-
-    # Optional debug log of a sample tank
-    try:
-        if tanks:
-            first = tanks[0]
+    # Optional debug log of a sample tank. Guarded so the log arguments
+    # (including the key-list allocation) are only built when debug is on.
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        if coordinator.tanks_by_id:
+            first = next(iter(coordinator.tanks_by_id.values()))
             _LOGGER.debug(
                 "Smart Oil Gauge (binary): first tank sample id=%s name=%s keys=%s",
                 first.get("tank_id"),
@@ -60,38 +48,40 @@ async def async_setup_entry(
             _LOGGER.debug(
                 "Smart Oil Gauge (binary): no tanks found in coordinator.data"
             )
-    except Exception:
-        _LOGGER.exception(
-            "Smart Oil Gauge (binary): error while logging first tank sample"
-        )
 
-    for tank in tanks:
-        tank_id = str(tank.get("tank_id", "unknown"))
-        if tank_id not in created_tank_ids:
-            created_tank_ids.add(tank_id)
-            entities.extend(build_entities_for_tank(tank))
+    # Initial entities, straight from the coordinator's per-update index.
+    created_tank_ids.update(coordinator.tanks_by_id)
+
+    entities: list[Entity] = [
+        LowOilSensor(coordinator, entry, tank_id) for tank_id in created_tank_ids
+    ]
 
     if entities:
         async_add_entities(entities)
 
     @callback
     def _coordinator_updated() -> None:
-        new_entities: List[Entity] = []
+        # Key-view set difference against the coordinator's index; nothing
+        # is walked or allocated when the tank set is unchanged.
+        new_ids = coordinator.tanks_by_id.keys() - created_tank_ids
+        if not new_ids:
+            return
 
-        for tank in _tanks_from(coordinator.data):
-            tank_id = str(tank.get("tank_id", "unknown"))
-            if tank_id not in created_tank_ids:
-                created_tank_ids.add(tank_id)
-                new_entities.extend(build_entities_for_tank(tank))
+        created_tank_ids.update(new_ids)
 
-        if new_entities:
-            _LOGGER.debug(
-                "Smart Oil Gauge (binary): discovered %d new tank(s); adding entities",
-                len(new_entities),
-            )
-            async_add_entities(new_entities)
+        new_entities: list[Entity] = [
+            LowOilSensor(coordinator, entry, tank_id) for tank_id in new_ids
+        ]
 
-    coordinator.async_add_listener(_coordinator_updated)
+        _LOGGER.debug(
+            "Smart Oil Gauge (binary): discovered %d new tank(s); adding entities",
+            len(new_entities),
+        )
+        async_add_entities(new_entities)
+
+    # Tie the listener's lifetime to the entry so reloads cannot stack up
+    # duplicate listeners each doing the same per-update work.
+    entry.async_on_unload(coordinator.async_add_listener(_coordinator_updated))
 
 
 class BaseTankBinarySensor(SmartOilTankEntity, BinarySensorEntity):
@@ -114,22 +104,48 @@ class LowOilSensor(BaseTankBinarySensor):
         super().__init__(coordinator, entry, tank_id)
         self._attr_unique_id = f"{entry.entry_id}_{tank_id}_low_oil"
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if oil is at/below low-level threshold, False otherwise.
+        # Gallons and threshold are recomputed once per coordinator update
+        # (see _handle_coordinator_update) so is_on stays a plain comparison
+        # no matter how often HA reads the state.
+        self._cached_gallons: float | None = None
+        self._cached_threshold: float | None = None
+        self._update_cached_state()
 
-        Returns None if we cannot determine the state (e.g., missing data).
-        """
+    def _update_cached_state(self) -> None:
+        """Recompute cached gallons and low-level threshold from tank data."""
         tank = self._tank()
         if not tank:
-            return None
+            self._cached_gallons = None
+            self._cached_threshold = None
+            return
 
-        gallons = _safe_float(tank.get("sensor_gallons"))
-        low_fraction = _safe_float(tank.get("low_level"))
-        capacity = _safe_float(tank.get("nominal"))
+        # Numeric fields are pre-converted to float (or None) by the
+        # coordinator at ingestion.
+        gallons = tank.get("sensor_gallons")
+        low_fraction = tank.get("low_level")
+        capacity = tank.get("nominal")
 
         if gallons is None or capacity is None or low_fraction is None:
+            self._cached_gallons = None
+            self._cached_threshold = None
+            return
+
+        self._cached_gallons = gallons
+        self._cached_threshold = capacity * low_fraction
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached values when the coordinator has new data."""
+        self._update_cached_state()
+        super()._handle_coordinator_update()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if oil is at/below low-level threshold, False otherwise.
+
+        Returns None if we cannot determine the state (e.g., missing data).
+        """
+        if self._cached_gallons is None or self._cached_threshold is None:
             return None
 
-        low_threshold_gallons = capacity * low_fraction
-        return gallons <= low_threshold_gallons
+        return self._cached_gallons <= self._cached_threshold
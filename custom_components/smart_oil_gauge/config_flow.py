@@ -17,7 +17,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import ApiError
 from .api import AuthError
@@ -124,8 +124,11 @@ class SmartOilGaugeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         username = user_input[CONF_USERNAME]
         password = user_input[CONF_PASSWORD]
 
-        # Create a temporary HTTP session just for this flow; HA manages it.
-        session = async_create_clientsession(self.hass)
+        # Use HA's shared session, the same one the coordinator will use.
+        # Cookies and warm keep-alive connections from this validation then
+        # carry over to the coordinator's first refresh instead of being
+        # thrown away with a flow-scoped session.
+        session = async_get_clientsession(self.hass)
         client = SmartOilClient(session)
 
         try:
@@ -20,12 +20,16 @@ from .const import DOMAIN
 # - Session cookies
 # - Passwords
 # - Usernames
-TO_REDACT = {
-    "PHPSESSID",
-    "ccf_tok",
-    "username",
-    "password",
-}
+# frozenset: async_redact_data re-checks membership for every key it walks,
+# and the set itself never changes.
+TO_REDACT = frozenset(
+    {
+        "PHPSESSID",
+        "ccf_tok",
+        "username",
+        "password",
+    }
+)
 
 
 async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry):
@@ -42,7 +46,11 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
     if coordinator is None:
         return {"error": "Coordinator not found"}
 
-    raw_data = coordinator.data or {}
+    raw_data = coordinator.data
+
+    # Nothing to redact (or walk) when there is no data yet.
+    if not raw_data:
+        return {}
 
     # async_redact_data deeply removes keys in TO_REDACT from nested structures.
     return async_redact_data(raw_data, TO_REDACT)
@@ -2,68 +2,49 @@
 Shared base entities and helpers for the Smart Oil Gauge integration.
 
 This module centralizes:
-- Common helper functions (e.g. _safe_float, _tanks_from)
+- Common helper functions (e.g. _safe_float)
 - Shared base entity classes for tank-based entities
 
 Both sensor.py and binary_sensor.py import from here to avoid duplication.
 """
 from __future__ import annotations
 
-import logging
 from typing import Any
-from typing import Dict
-from typing import List
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 
-_LOGGER = logging.getLogger(__name__)
-
 
 # -----------------------------------------------------------------------------
 # Helper functions
 # -----------------------------------------------------------------------------
 def _safe_float(x: Any) -> float | None:
-    """Safely convert a value to float, returning None on failure."""
+    """Safely convert a value to float, returning None on failure.
+
+    The exact-type checks up front dispatch the common cases directly: the
+    API returns numeric fields as strings, pre-normalized values are already
+    floats, and missing fields are None. Only oddball inputs fall through to
+    the catch-all try/except.
+    """
+    if type(x) is float:
+        return x
+    if type(x) is str:
+        try:
+            return float(x)
+        except ValueError:
+            return None
+    if type(x) is int:
+        return float(x)
+    if x is None:
+        return None
     try:
         return float(x)
     except (ValueError, TypeError):
         return None
 
 
-def _tanks_from(data: Dict[str, Any] | None) -> List[Dict[str, Any]]:
-    """Extract the 'tanks' list from the coordinator data.
-
-    Expected shape:
-        {
-            "tanks": [
-                { "tank_id": 123, "tank_name": "...", ... },
-                ...
-            ]
-        }
-
-    Returns [] if the data is missing or malformed.
-    """
-    if data is None:
-        _LOGGER.debug("Smart Oil Gauge: coordinator.data is None")
-        return []
-
-    if not isinstance(data, dict):
-        _LOGGER.debug(
-            "Smart Oil Gauge: coordinator.data is not a dict (type=%s)", type(data)
-        )
-        return []
-
-    tanks = data.get("tanks")
-    if isinstance(tanks, list):
-        return tanks
-
-    _LOGGER.debug("Smart Oil Gauge: 'tanks' key missing or invalid in data")
-    return []
-
-
 # -----------------------------------------------------------------------------
 # Base entity classes
 # -----------------------------------------------------------------------------
@@ -99,24 +80,28 @@ class SmartOilTankEntity(SmartOilBaseEntity):
         super().__init__(coordinator, entry)
         self._tank_id = tank_id
 
-    def _tank(self) -> Dict[str, Any] | None:
-        """Return the tank dict for this entity's tank_id, or None if missing."""
-        for t in _tanks_from(self.coordinator.data):
-            if str(t.get("tank_id")) == self._tank_id:
-                return t
-        return None
-
-    @property
-    def device_info(self) -> Dict[str, Any]:
-        """Return device information for this tank."""
-        t = self._tank() or {}
-        name = t.get("tank_name") or f"Tank {self._tank_id}"
-
-        return {
-            "identifiers": {(DOMAIN, f"tank_{self._tank_id}")},
-            "via_device": (DOMAIN, self._entry.entry_id),
-            "name": name,
+        # Everything in device_info except the name is fixed for the
+        # lifetime of the entity, so build it once here; device_info then
+        # only has to merge in the (possibly renamed) tank name.
+        self._static_device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, f"tank_{tank_id}")},
+            "via_device": (DOMAIN, entry.entry_id),
             "manufacturer": "Connected Consumer Fuel",
             "model": "SmartOilGauge",
             "configuration_url": "https://app.smartoilgauge.com/",
         }
+
+    def _tank(self) -> dict[str, Any] | None:
+        """Return the tank dict for this entity's tank_id, or None if missing.
+
+        The coordinator rebuilds its tanks_by_id index once per update, so
+        this is a single dict get on every property read.
+        """
+        return self.coordinator.tanks_by_id.get(self._tank_id)
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information for this tank."""
+        t = self._tank()
+        name = (t.get("tank_name") if t else None) or f"Tank {self._tank_id}"
+        return {**self._static_device_info, "name": name}
@@ -3,8 +3,6 @@ from __future__ import annotations
 
 import logging
 from typing import Any
-from typing import Iterable
-from typing import List
 
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.sensor import SensorEntity
@@ -18,16 +16,18 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
-from .entity import _safe_float
-from .entity import _tanks_from
 from .entity import SmartOilTankEntity
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _fraction_to_percent(raw: float) -> float:
+    """Convert a 0-1 fraction (pre-converted by the coordinator) to percent."""
+    return raw * 100.0
+
+
 # -----------------------------------------------------------------------------
 # async_setup_entry
 # -----------------------------------------------------------------------------
@@ -43,35 +43,25 @@ async def async_setup_entry(
     # new entities only when new tanks appear in future coordinator updates.
     created_tank_ids: set[str] = set()
 
-    # Helper to build all sensor entities for a single tank
-    def build_entities_for_tank(tank: dict[str, Any]) -> Iterable[Entity]:
-        tank_id = str(tank.get("tank_id", "unknown"))
-        return (
-            TankNameSensor(coordinator, entry, tank_id),
-            TankIdSensor(coordinator, entry, tank_id),
-            GallonsSensor(coordinator, entry, tank_id),
-            SensorUsgSensor(coordinator, entry, tank_id),
-            PercentFullSensor(coordinator, entry, tank_id),
-            LastReadSensor(coordinator, entry, tank_id),
-            BatteryStatusSensor(coordinator, entry, tank_id),
-            StatusSensor(coordinator, entry, tank_id),
-            NominalCapacitySensor(coordinator, entry, tank_id),
-            FillableCapacitySensor(coordinator, entry, tank_id),
-            LowLevelSensor(coordinator, entry, tank_id),
-            ZipSensor(coordinator, entry, tank_id),
-        )
+    # Helper to build all sensor entities for a single tank; the class list
+    # itself is the module-level _TANK_SENSOR_CLASSES constant.
+    def build_entities_for_tank(tank_id: str) -> list[Entity]:
+        # Build the "<entry_id>_<tank_id>_" prefix once per tank rather
+        # than re-formatting it in each of the twelve constructors.
+        uid_prefix = f"{entry.entry_id}_{tank_id}_"
+        return [
+            cls(coordinator, entry, tank_id, uid_prefix=uid_prefix)
+            for cls in _TANK_SENSOR_CLASSES
+        ]
 
     # Always include the account-level sensor so the account appears as a device
-    entities: List[Entity] = [AccountSensor(coordinator, entry)]
+    entities: list[Entity] = [AccountSensor(coordinator, entry)]
 
-    tanks = _tanks_from(coordinator.data)
-
-    # Initial entities for existing tanks
-    for tank in tanks:
-        tank_id = str(tank.get("tank_id", "unknown"))
-        if tank_id not in created_tank_ids:
-            created_tank_ids.add(tank_id)
-            entities.extend(build_entities_for_tank(tank))
+    # Initial entities for existing tanks, straight from the coordinator's
+    # per-update index.
+    created_tank_ids.update(coordinator.tanks_by_id)
+    for tank_id in created_tank_ids:
+        entities.extend(build_entities_for_tank(tank_id))
 
     if entities:
         async_add_entities(entities)
@@ -79,22 +69,31 @@ async def async_setup_entry(
     # Listener to dynamically create entities when new tanks appear
     @callback
     def _coordinator_updated() -> None:
-        new_entities: List[Entity] = []
-
-        for tank in _tanks_from(coordinator.data):
-            tank_id = str(tank.get("tank_id", "unknown"))
-            if tank_id not in created_tank_ids:
-                created_tank_ids.add(tank_id)
-                new_entities.extend(build_entities_for_tank(tank))
-
-        if new_entities:
-            _LOGGER.debug(
-                "Smart Oil Gauge (sensor): discovered %d new tank(s); adding entities",
-                len(new_entities),
-            )
-            async_add_entities(new_entities)
+        # Steady-state polls almost never change the tank set, so bail out
+        # on a key-view set difference before building anything.
+        new_ids = coordinator.tanks_by_id.keys() - created_tank_ids
+        if not new_ids:
+            return
+
+        created_tank_ids.update(new_ids)
+
+        # All new tanks' entities go to HA in a single flat batch so
+        # async_add_entities is called at most once per update.
+        new_entities: list[Entity] = [
+            entity
+            for tank_id in new_ids
+            for entity in build_entities_for_tank(tank_id)
+        ]
+
+        _LOGGER.debug(
+            "Smart Oil Gauge (sensor): discovered %d new tank(s); adding entities",
+            len(new_entities),
+        )
+        async_add_entities(new_entities)
 
-    coordinator.async_add_listener(_coordinator_updated)
+    # Tie the listener's lifetime to the entry so reloads cannot stack up
+    # duplicate listeners each doing the same per-update work.
+    entry.async_on_unload(coordinator.async_add_listener(_coordinator_updated))
 
 
 # -----------------------------------------------------------------------------
@@ -103,11 +102,51 @@ async def async_setup_entry(
 class BaseTankSensor(SmartOilTankEntity, SensorEntity):
     """Base class for all per-tank sensors."""
 
+    # No per-subclass instance attributes: everything lives in _attr_* slots
+    # on the (unslotted) Entity base, so empty __slots__ here and in the
+    # subclasses keeps these classes from growing their own dict entries.
+    __slots__ = ()
+
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
+    # Suffix appended to "<entry_id>_<tank_id>_" to form the unique_id.
+    # Each subclass sets this at class level instead of overriding __init__
+    # just to build the same f-string.
+    _unique_id_suffix = ""
+
+    # Tank-dict field read by the shared native_value below, plus an
+    # optional converter applied to non-empty raw values. Sensors whose
+    # value is derived rather than read straight from a field (percent
+    # full, last read) override native_value instead.
+    _tank_field = ""
+    _value_converter = staticmethod(lambda raw: raw)
+
+    def __init__(
+        self,
+        coordinator,
+        entry: ConfigEntry,
+        tank_id: str,
+        uid_prefix: str | None = None,
+    ) -> None:
         SmartOilTankEntity.__init__(self, coordinator, entry, tank_id)
         SensorEntity.__init__(self)
+        # Callers creating a whole batch of sensors for one tank pass the
+        # shared "<entry_id>_<tank_id>_" prefix in; standalone construction
+        # still works without it.
+        if uid_prefix is None:
+            uid_prefix = f"{entry.entry_id}_{tank_id}_"
+        self._attr_unique_id = uid_prefix + self._unique_id_suffix
+
+    @property
+    def native_value(self) -> Any:
+        """Return the value of this sensor's tank field."""
+        t = self._tank()
+        if not t:
+            return None
+        raw = t.get(self._tank_field)
+        if raw in (None, ""):
+            return None
+        return self._value_converter(raw)
 
 
 class AccountSensor(CoordinatorEntity, SensorEntity):
@@ -122,22 +161,25 @@ class AccountSensor(CoordinatorEntity, SensorEntity):
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_tank_count"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Account-level device for all tanks."""
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
+        # Nothing in the account device ever changes, so build it once
+        # instead of on every registry/frontend query.
+        self._device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
             "name": "Smart Oil Gauge",
             "manufacturer": "Connected Consumer Fuel",
             "model": "Smart Oil Gauge Account",
             "configuration_url": "https://app.smartoilgauge.com/",
         }
 
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Account-level device for all tanks."""
+        return self._device_info
+
     @property
     def native_value(self) -> int:
         """Return number of tanks associated with this account."""
-        tanks = _tanks_from(self.coordinator.data)
-        return len(tanks)
+        return len(self.coordinator.tanks_by_id)
 
 
 # -----------------------------------------------------------------------------
@@ -146,52 +188,40 @@ class AccountSensor(CoordinatorEntity, SensorEntity):
 class TankNameSensor(BaseTankSensor):
     """Tank name reported by the API."""
 
+    __slots__ = ()
+
     _attr_name = "Tank Name"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_name"
-
-    @property
-    def native_value(self) -> str | None:
-        t = self._tank()
-        return t.get("tank_name") if t else None
+    _unique_id_suffix = "name"
+    _tank_field = "tank_name"
 
 
 class TankIdSensor(BaseTankSensor):
     """Tank ID as seen by the Smart Oil Gauge API."""
 
+    __slots__ = ()
+
     _attr_name = "Tank ID"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_tank_id"
-
-    @property
-    def native_value(self) -> Any:
-        t = self._tank()
-        return t.get("tank_id") if t else None
+    _unique_id_suffix = "tank_id"
+    _tank_field = "tank_id"
 
 
 class ZipSensor(BaseTankSensor):
     """ZIP code associated with this tank."""
 
+    __slots__ = ()
+
     _attr_name = "ZIP Code"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_zip"
-
-    @property
-    def native_value(self) -> str | None:
-        t = self._tank()
-        return t.get("zip_code") if t else None
+    _unique_id_suffix = "zip"
+    _tank_field = "zip_code"
 
 
 # -----------------------------------------------------------------------------
@@ -200,25 +230,23 @@ class ZipSensor(BaseTankSensor):
 class GallonsSensor(BaseTankSensor):
     """Current gallons remaining in the tank."""
 
+    __slots__ = ()
+
     _attr_name = "Gallons"
     _attr_native_unit_of_measurement = UnitOfVolume.GALLONS
     _attr_device_class = SensorDeviceClass.VOLUME
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0  # Show whole gallons by default
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_gallons"
-
-    @property
-    def native_value(self) -> float | None:
-        t = self._tank()
-        return _safe_float(t.get("sensor_gallons")) if t else None
+    _unique_id_suffix = "gallons"
+    _tank_field = "sensor_gallons"
 
 
 class NominalCapacitySensor(BaseTankSensor):
     """Configured nominal tank capacity in gallons."""
 
+    __slots__ = ()
+
     _attr_name = "Nominal Capacity"
     _attr_native_unit_of_measurement = UnitOfVolume.GALLONS
     _attr_device_class = SensorDeviceClass.VOLUME
@@ -226,21 +254,15 @@ class NominalCapacitySensor(BaseTankSensor):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_nominal"
-
-    @property
-    def native_value(self) -> float | None:
-        t = self._tank()
-        if not t:
-            return None
-        return _safe_float(t.get("nominal"))
+    _unique_id_suffix = "nominal"
+    _tank_field = "nominal"
 
 
 class FillableCapacitySensor(BaseTankSensor):
     """Configured fillable capacity in gallons (usually less than nominal)."""
 
+    __slots__ = ()
+
     _attr_name = "Fillable Capacity"
     _attr_native_unit_of_measurement = UnitOfVolume.GALLONS
     _attr_device_class = SensorDeviceClass.VOLUME
@@ -248,16 +270,8 @@ class FillableCapacitySensor(BaseTankSensor):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_fillable"
-
-    @property
-    def native_value(self) -> float | None:
-        tank = self._tank()
-        if not tank:
-            return None
-        return _safe_float(tank.get("fillable"))
+    _unique_id_suffix = "fillable"
+    _tank_field = "fillable"
 
 
 # -----------------------------------------------------------------------------
@@ -266,6 +280,8 @@ class FillableCapacitySensor(BaseTankSensor):
 class SensorUsgSensor(BaseTankSensor):
     """Average oil usage in gallons per day, as reported by the API."""
 
+    __slots__ = ()
+
     _attr_name = "Oil Usage"
     # The underlying API field ("sensor_usg") is gal/day.
     # We use gal/d which will be supported in a future version of Home Assistant.
@@ -275,19 +291,8 @@ class SensorUsgSensor(BaseTankSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 2
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_sensor_usg"
-
-    @property
-    def native_value(self) -> float | None:
-        t = self._tank()
-        raw = t.get("sensor_usg") if t else None
-
-        if raw in (None, ""):
-            return None
-
-        return _safe_float(raw)
+    _unique_id_suffix = "sensor_usg"
+    _tank_field = "sensor_usg"
 
 
 # -----------------------------------------------------------------------------
@@ -296,116 +301,99 @@ class SensorUsgSensor(BaseTankSensor):
 class PercentFullSensor(BaseTankSensor):
     """Tank percent full, computed from gallons and nominal capacity."""
 
+    __slots__ = ()
+
     _attr_name = "Percent Full"
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 1
     _attr_device_class = SensorDeviceClass.BATTERY  # conceptually "fullness"
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_percent"
-
-    @property
-    def native_value(self) -> float | None:
-        t = self._tank()
-        if not t:
-            return None
-
-        gallons = _safe_float(t.get("sensor_gallons")) or 0.0
-        capacity = _safe_float(t.get("nominal")) or 0.0
-
-        if capacity <= 0:
-            return 0.0
-
-        return round(gallons / capacity * 100.0, 2)
+    # Computed once per refresh in the coordinator's normalization pass
+    # (see _normalize_tank_data in __init__.py).
+    _unique_id_suffix = "percent"
+    _tank_field = "_percent_full"
 
 
 class LowLevelSensor(BaseTankSensor):
     """Configured low-level threshold as a percentage of nominal capacity."""
 
+    __slots__ = ()
+
     _attr_name = "Low Level Threshold"
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_suggested_display_precision = 0
     _attr_icon = "mdi:gauge-low"
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_low_level"
-
-    @property
-    def native_value(self) -> float | None:
-        t = self._tank()
-        if not t:
-            return None
-
-        fraction = _safe_float(t.get("low_level"))
-        if fraction is None:
-            return None
-
-        return fraction * 100.0
+    _unique_id_suffix = "low_level"
+    _tank_field = "low_level"
+    _value_converter = staticmethod(_fraction_to_percent)
 
 
 class BatteryStatusSensor(BaseTankSensor):
     """Battery status text as reported by the Smart Oil Gauge device."""
 
+    __slots__ = ()
+
     _attr_name = "Battery Status"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_battery_status"
-
-    @property
-    def native_value(self) -> str | None:
-        t = self._tank()
-        return t.get("battery") if t else None
+    _unique_id_suffix = "battery_status"
+    _tank_field = "battery"
 
     @property
     def icon(self) -> str:
-        val = (self.native_value or "").lower()
-        # The only documented value is "excellent" – treat others as a warning.
-        return "mdi:battery" if val == "excellent" else "mdi:battery-alert"
+        # Chosen once per refresh in the coordinator's normalization pass.
+        t = self._tank()
+        return t["_battery_icon"] if t else "mdi:battery-alert"
 
 
 class StatusSensor(BaseTankSensor):
     """Sensor health / status string as reported by the API."""
 
+    __slots__ = ()
+
     _attr_name = "Sensor Status"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_sensor_status"
-
-    @property
-    def native_value(self) -> str | None:
-        t = self._tank()
-        return t.get("sensor_status") if t else None
+    _unique_id_suffix = "sensor_status"
+    _tank_field = "sensor_status"
 
 
 class LastReadSensor(BaseTankSensor):
     """Timestamp when the tank was last read by the device."""
 
+    __slots__ = ()
+
     _attr_name = "Last Read"
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
-    def __init__(self, coordinator, entry: ConfigEntry, tank_id: str) -> None:
-        super().__init__(coordinator, entry, tank_id)
-        self._attr_unique_id = f"{entry.entry_id}_{tank_id}_last_read"
+    # The coordinator converts the epoch once per refresh and stores the
+    # aware local datetime alongside the raw field (see _normalize_tank_data
+    # in __init__.py), so reads are plain dict gets.
+    _unique_id_suffix = "last_read"
+    _tank_field = "_last_read_dt"
 
-    @property
-    def native_value(self):
-        """Return the last-read timestamp as an aware datetime in local time."""
-        t = self._tank()
-        if not t:
-            return None
-
-        try:
-            epoch = int(t.get("last_read"))
-        except (ValueError, TypeError):
-            return None
 
-        return dt_util.as_local(dt_util.utc_from_timestamp(epoch))
+# -----------------------------------------------------------------------------
+# Entity factory table
+# -----------------------------------------------------------------------------
+# Every per-tank sensor class, in the order their entities are created for a
+# tank. Defined once at module scope so setup and dynamic tank discovery do
+# not rebuild the class list per tank.
+_TANK_SENSOR_CLASSES = (
+    TankNameSensor,
+    TankIdSensor,
+    GallonsSensor,
+    SensorUsgSensor,
+    PercentFullSensor,
+    LastReadSensor,
+    BatteryStatusSensor,
+    StatusSensor,
+    NominalCapacitySensor,
+    FillableCapacitySensor,
+    LowLevelSensor,
+    ZipSensor,
+)
@@ -1,87 +1,101 @@
 """Tests for Smart Oil Gauge api."""
-import asyncio
-
-import aiohttp
+import pytest
+from custom_components.smart_oil_gauge.api import (
+    ApiError,
+)
+from custom_components.smart_oil_gauge.api import (
+    AuthError,
+)
 from custom_components.smart_oil_gauge.api import (
-    SmartOilGaugeApiClient,
+    SmartOilClient,
+)
+from custom_components.smart_oil_gauge.const import (
+    AJAX_URL,
+)
+from custom_components.smart_oil_gauge.const import (
+    LOGIN_URL,
 )
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+# The hidden input _fetch_nonce looks for on the login page.
+NONCE_INPUT = b'<input type="hidden" name="ccf_nonce" value="abc123">'
 
-async def test_api(hass, aioclient_mock, caplog):
-    """Test API calls."""
 
-    # To test the api submodule, we first create an instance of our API client
-    api = SmartOilGaugeApiClient("test", "test", async_get_clientsession(hass))
+async def test_fetch_nonce_across_chunk_boundary(hass, aioclient_mock):
+    """The nonce is found even when the hidden input straddles a read chunk.
+
+    _fetch_nonce reads the page in 4096-byte chunks and re-searches the
+    accumulated buffer, so a marker split across a chunk boundary must
+    still be found once the second chunk arrives.
+    """
+    client = SmartOilClient(async_get_clientsession(hass))
+
+    # Pad so the hidden input starts just before the 4096-byte boundary
+    # and ends after it; trailing bytes make the body span several chunks.
+    body = b"<html>" + b"x" * (4096 - 6 - 20) + NONCE_INPUT + b"y" * 8192
+    aioclient_mock.get(LOGIN_URL, content=body)
+
+    assert await client._fetch_nonce() == "abc123"
+
+
+async def test_fetch_nonce_beyond_search_limit(hass, aioclient_mock):
+    """A nonce past the 64 KB search limit is treated as absent."""
+    client = SmartOilClient(async_get_clientsession(hass))
+
+    body = b"<html>" + b"x" * (64 * 1024) + NONCE_INPUT
+    aioclient_mock.get(LOGIN_URL, content=body)
+
+    assert await client._fetch_nonce() is None
 
-    # Use aioclient_mock which is provided by `pytest_homeassistant_custom_components`
-    # to mock responses to aiohttp requests. In this case we are telling the mock to
-    # return {"test": "test"} when a `GET` call is made to the specified URL. We then
-    # call `async_get_data` which will make that `GET` request.
-    aioclient_mock.get(
-        "https://jsonplaceholder.typicode.com/posts/1", json={"test": "test"}
-    )
-    assert await api.async_get_data() == {"test": "test"}
-
-    # We do the same for `async_set_title`. Note the difference in the mock call
-    # between the previous step and this one. We use `patch` here instead of `get`
-    # because we know that `async_set_title` calls `api_wrapper` with `patch` as the
-    # first parameter
-    aioclient_mock.patch("https://jsonplaceholder.typicode.com/posts/1")
-    assert await api.async_set_title("test") is None
-
-    # In order to get 100% coverage, we need to test `api_wrapper` to test the code
-    # that isn't already called by `async_get_data` and `async_set_title`. Because the
-    # only logic that lives inside `api_wrapper` that is not being handled by a third
-    # party library (aiohttp) is the exception handling, we also want to simulate
-    # raising the exceptions to ensure that the function handles them as expected.
-    # The caplog fixture allows access to log messages in tests. This is particularly
-    # useful during exception handling testing since often the only action as part of
-    # exception handling is a logging statement
-    caplog.clear()
-    aioclient_mock.put(
-        "https://jsonplaceholder.typicode.com/posts/1", exc=asyncio.TimeoutError
-    )
-    assert (
-        await api.api_wrapper("put", "https://jsonplaceholder.typicode.com/posts/1")
-        is None
-    )
-    assert (
-        len(caplog.record_tuples) == 1
-        and "Timeout error fetching information from" in caplog.record_tuples[0][2]
-    )
 
-    caplog.clear()
+async def test_fetch_nonce_missing(hass, aioclient_mock):
+    """A login page without the hidden input yields no nonce."""
+    client = SmartOilClient(async_get_clientsession(hass))
+
+    aioclient_mock.get(LOGIN_URL, content=b"<html><body>no form</body></html>")
+
+    assert await client._fetch_nonce() is None
+
+
+async def test_get_tanks_list_login_page_raises_auth_error(hass, aioclient_mock):
+    """An HTML login page from the AJAX endpoint means the session expired."""
+    client = SmartOilClient(async_get_clientsession(hass))
+
     aioclient_mock.post(
-        "https://jsonplaceholder.typicode.com/posts/1", exc=aiohttp.ClientError
-    )
-    assert (
-        await api.api_wrapper("post", "https://jsonplaceholder.typicode.com/posts/1")
-        is None
-    )
-    assert (
-        len(caplog.record_tuples) == 1
-        and "Error fetching information from" in caplog.record_tuples[0][2]
+        AJAX_URL,
+        text='<html><form><input name="user_pass"></form></html>',
+        headers={"Content-Type": "text/html"},
     )
 
-    caplog.clear()
-    aioclient_mock.post("https://jsonplaceholder.typicode.com/posts/2", exc=Exception)
-    assert (
-        await api.api_wrapper("post", "https://jsonplaceholder.typicode.com/posts/2")
-        is None
-    )
-    assert (
-        len(caplog.record_tuples) == 1
-        and "Something really wrong happened!" in caplog.record_tuples[0][2]
-    )
+    with pytest.raises(AuthError):
+        await client.get_tanks_list()
 
-    caplog.clear()
-    aioclient_mock.post("https://jsonplaceholder.typicode.com/posts/3", exc=TypeError)
-    assert (
-        await api.api_wrapper("post", "https://jsonplaceholder.typicode.com/posts/3")
-        is None
+
+async def test_get_tanks_list_unexpected_html_raises_api_error(hass, aioclient_mock):
+    """A non-JSON body without login markers is a generic API error."""
+    client = SmartOilClient(async_get_clientsession(hass))
+
+    aioclient_mock.post(
+        AJAX_URL,
+        text="<html><body>maintenance</body></html>",
+        headers={"Content-Type": "text/html"},
     )
-    assert (
-        len(caplog.record_tuples) == 1
-        and "Error parsing information from" in caplog.record_tuples[0][2]
+
+    with pytest.raises(ApiError):
+        await client.get_tanks_list()
+
+
+async def test_get_tanks_list_success(hass, aioclient_mock):
+    """A JSON response with a tanks list is returned as-is."""
+    client = SmartOilClient(async_get_clientsession(hass))
+
+    # aioclient_mock does not set Content-Type for json= responses, and
+    # get_tanks_list checks the header before decoding.
+    aioclient_mock.post(
+        AJAX_URL,
+        json={"result": "ok", "tanks": [{"tank_id": 123}]},
+        headers={"Content-Type": "application/json"},
     )
+
+    data = await client.get_tanks_list()
+    assert data["tanks"][0]["tank_id"] == 123